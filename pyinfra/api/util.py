@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import os
 from functools import wraps
 from hashlib import sha1
 from inspect import getframeinfo, stack
 from io import BytesIO, StringIO
 from os import getcwd, path, stat
 from socket import error as socket_error, timeout as timeout_error
+from stat import S_ISREG
 from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union
 
 import click
@@ -389,6 +391,86 @@ class get_file_io:
             return self.filename_or_io
 
 
+def _get_binary_fileno(file_io) -> Optional[int]:
+    # Not every file-like object has a string mode (GzipFile uses an int before 3.13)
+    mode = getattr(file_io, "mode", None)
+    if not isinstance(mode, str) or "b" not in mode:
+        return None
+
+    try:
+        return file_io.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _sendfile_file_io(file_io, dest_io) -> bool:
+    """
+    Copies between two real binary files within the kernel using ``sendfile``. Returns
+    ``False``, having copied nothing, where this isn't possible.
+    """
+
+    if not hasattr(os, "sendfile"):
+        return False
+
+    in_fd = _get_binary_fileno(file_io)
+    out_fd = _get_binary_fileno(dest_io)
+
+    if in_fd is None or out_fd is None:
+        return False
+
+    in_stat = os.fstat(in_fd)
+    if not S_ISREG(in_stat.st_mode):
+        return False
+
+    # Write out anything already buffered so the descriptor offset is correct
+    dest_io.flush()
+
+    start = offset = file_io.tell()
+
+    # Send until EOF rather than to the stat size, which is wrong for pseudo files
+    # (procfs/sysfs) and files that grow during the copy.
+    while True:
+        try:
+            sent = os.sendfile(
+                out_fd,
+                in_fd,
+                offset,
+                max(in_stat.st_size - offset, BLOCKSIZE),
+            )
+        except OSError:
+            # Some platforms (MacOS) only support sending to sockets
+            if offset == start:
+                return False
+            raise
+
+        if sent == 0:
+            break
+        offset += sent
+
+    file_io.seek(offset)
+    return True
+
+
+def copy_file_io(file_io, dest_io) -> None:
+    """
+    Copies a file or IO object into a binary IO object using a buffer to handle larger
+    files, encoding any text read from the source. Copies between real files happen
+    within the kernel where supported.
+    """
+
+    if _sendfile_file_io(file_io, dest_io):
+        return
+
+    buff = file_io.read(BLOCKSIZE)
+
+    while len(buff) > 0:
+        if isinstance(buff, str):
+            buff = buff.encode("utf-8")
+
+        dest_io.write(buff)
+        buff = file_io.read(BLOCKSIZE)
+
+
 def get_file_sha1(filename_or_io):
     """
     Calculates the SHA1 of a file or file object using a buffer to handle larger files.
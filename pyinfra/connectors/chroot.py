@@ -1,5 +1,3 @@
-import os
-from tempfile import mkstemp
 from typing import TYPE_CHECKING, Optional
 
 import click
@@ -8,7 +6,7 @@ from typing_extensions import Unpack
 from pyinfra import local, logger
 from pyinfra.api import QuoteString, StringCommand
 from pyinfra.api.exceptions import ConnectError, InventoryError, PyinfraError
-from pyinfra.api.util import get_file_io, memoize
+from pyinfra.api.util import copy_file_io, get_file_io, memoize
 from pyinfra.progress import progress_spinner
 
 from .base import BaseConnector
@@ -26,6 +24,19 @@ def show_warning():
     logger.warning("The @chroot connector is in beta!")
 
 
+def _needs_unix_command(command_arguments) -> bool:
+    """
+    Whether a command needs wrapping by ``make_unix_command_for_host``. With no auth,
+    env or directory changes and the default shell the wrapped command would only nest
+    another ``sh -c`` inside the one the chroot command already runs.
+    """
+
+    if any(command_arguments.get(key) for key in ("_sudo", "_su_user", "_doas", "_env", "_chdir")):
+        return True
+
+    return command_arguments.get("_shell_executable", "sh") not in ("sh", None)
+
+
 class ChrootConnector(BaseConnector):
     """
     The chroot connector allows you to execute operations within another root.
@@ -35,6 +46,8 @@ class ChrootConnector(BaseConnector):
 
     local: LocalConnector
 
+    chroot_directory: str
+
     def __init__(self, state: "State", host: "Host"):
         super().__init__(state, host)
         self.local = LocalConnector(state, host)
@@ -64,6 +77,7 @@ class ChrootConnector(BaseConnector):
         except PyinfraError as e:
             raise ConnectError(e.args[0])
 
+        self.chroot_directory = chroot_directory
         self.host.connector_data["chroot_directory"] = chroot_directory
 
     def run_shell_command(
@@ -75,9 +89,12 @@ class ChrootConnector(BaseConnector):
     ):
         local_arguments = extract_control_arguments(command_arguments)
 
-        chroot_directory = self.host.connector_data["chroot_directory"]
+        chroot_directory = self.chroot_directory
 
-        command = make_unix_command_for_host(self.state, self.host, command, **command_arguments)
+        if _needs_unix_command(command_arguments):
+            command = make_unix_command_for_host(
+                self.state, self.host, command, **command_arguments
+            )
         command = QuoteString(command)
 
         logger.debug("--> Running chroot command on (%s): %s", chroot_directory, command)
@@ -106,36 +123,17 @@ class ChrootConnector(BaseConnector):
         print_input: bool = False,
         **kwargs,  # ignored (sudo/etc)
     ):
-        _, temp_filename = mkstemp()
-
-        try:
-            # Load our file or IO object and write it to the temporary file
-            with get_file_io(filename_or_io) as file_io:
-                with open(temp_filename, "wb") as temp_f:
-                    data = file_io.read()
-
-                    if isinstance(data, str):
-                        data = data.encode()
+        """
+        Upload a file/IO object by writing it directly beneath the chroot directory,
+        which lives on the local filesystem.
+        """
 
-                    temp_f.write(data)
+        chroot_directory = self.chroot_directory
 
-            chroot_directory = self.host.connector_data["chroot_directory"]
-            chroot_command = StringCommand(
-                "cp",
-                temp_filename,
-                f"{chroot_directory}/{remote_filename}",
-            )
-
-            status, output = self.local.run_shell_command(
-                chroot_command,
-                print_output=print_output,
-                print_input=print_input,
-            )
-        finally:
-            os.remove(temp_filename)
-
-        if not status:
-            raise IOError(output.stderr)
+        # Load our file or IO object and write it straight into the chroot
+        with get_file_io(filename_or_io) as file_io:
+            with open(f"{chroot_directory}/{remote_filename}", "wb") as chroot_f:
+                copy_file_io(file_io, chroot_f)
 
         if print_output:
             click.echo(
@@ -146,7 +144,7 @@ class ChrootConnector(BaseConnector):
                 err=True,
             )
 
-        return status
+        return True
 
     def get_file(
         self,
@@ -157,39 +155,16 @@ class ChrootConnector(BaseConnector):
         print_input: bool = False,
         **kwargs,  # ignored (sudo/etc)
     ):
-        _, temp_filename = mkstemp()
-
-        try:
-            chroot_directory = self.host.connector_data["chroot_directory"]
-            chroot_command = StringCommand(
-                "cp",
-                f"{chroot_directory}/{remote_filename}",
-                temp_filename,
-            )
-
-            status, output = self.local.run_shell_command(
-                chroot_command,
-                print_output=print_output,
-                print_input=print_input,
-            )
-
-            # Load the temporary file and write it to our file or IO object
-            with open(temp_filename, "rb") as temp_f:
-                with get_file_io(filename_or_io, "wb") as file_io:
-                    data = temp_f.read()
-                    data_bytes: bytes
-
-                    if isinstance(data, str):
-                        data_bytes = data.encode()
-                    else:
-                        data_bytes = data
+        """
+        Download a file by reading it directly from beneath the chroot directory.
+        """
 
-                    file_io.write(data_bytes)
-        finally:
-            os.remove(temp_filename)
+        chroot_directory = self.chroot_directory
 
-        if not status:
-            raise IOError(output.stderr)
+        # Load the chroot file and write it to our file or IO object
+        with open(f"{chroot_directory}/{remote_filename}", "rb") as chroot_f:
+            with get_file_io(filename_or_io, "wb") as file_io:
+                copy_file_io(chroot_f, file_io)
 
         if print_output:
             click.echo(
@@ -200,4 +175,4 @@ class ChrootConnector(BaseConnector):
                 err=True,
             )
 
-        return status
+        return True
@@ -11,7 +11,7 @@ from typing_extensions import TypedDict, Unpack
 from pyinfra import local, logger
 from pyinfra.api import QuoteString, StringCommand
 from pyinfra.api.exceptions import ConnectError, InventoryError, PyinfraError
-from pyinfra.api.util import get_file_io
+from pyinfra.api.util import copy_file_io, get_file_io
 from pyinfra.progress import progress_spinner
 
 from .base import BaseConnector, DataMeta
@@ -197,12 +197,7 @@ class DockerConnector(BaseConnector):
             # Load our file or IO object and write it to the temporary file
             with get_file_io(filename_or_io) as file_io:
                 with open(temp_filename, "wb") as temp_f:
-                    data = file_io.read()
-
-                    if isinstance(data, str):
-                        data = data.encode()
-
-                    temp_f.write(data)
+                    copy_file_io(file_io, temp_f)
 
             docker_command = StringCommand(
                 "docker",
@@ -267,8 +262,7 @@ class DockerConnector(BaseConnector):
             # Load the temporary file and write it to our file or IO object
             with open(temp_filename, "rb") as temp_f:
                 with get_file_io(filename_or_io, "wb") as file_io:
-                    data = temp_f.read()
-                    file_io.write(data)
+                    copy_file_io(temp_f, file_io)
         finally:
             os.close(fd)
             os.remove(temp_filename)
@@ -8,7 +8,7 @@ from typing_extensions import Unpack
 from pyinfra import logger
 from pyinfra.api import QuoteString, StringCommand
 from pyinfra.api.exceptions import ConnectError, InventoryError, PyinfraError
-from pyinfra.api.util import get_file_io, memoize
+from pyinfra.api.util import copy_file_io, get_file_io, memoize
 from pyinfra.progress import progress_spinner
 
 from .base import BaseConnector
@@ -172,12 +172,7 @@ class DockerSSHConnector(BaseConnector):
         # Load our file or IO object and write it to the temporary file
         with get_file_io(filename_or_io) as file_io:
             with open(local_temp_filename, "wb") as temp_f:
-                data = file_io.read()
-
-                if isinstance(data, str):
-                    data = data.encode()
-
-                temp_f.write(data)
+                copy_file_io(file_io, temp_f)
 
         # upload file to remote server
         ssh_status = self.ssh.put_file(local_temp_filename, remote_temp_filename)
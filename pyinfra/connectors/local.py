@@ -1,6 +1,5 @@
-import os
 from shutil import which
-from tempfile import mkstemp
+from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, Tuple
 
 import click
@@ -9,7 +8,7 @@ from typing_extensions import Unpack
 from pyinfra import logger
 from pyinfra.api.command import QuoteString, StringCommand
 from pyinfra.api.exceptions import InventoryError
-from pyinfra.api.util import get_file_io
+from pyinfra.api.util import copy_file_io, get_file_io
 
 from .base import BaseConnector
 from .util import (
@@ -118,22 +117,15 @@ class LocalConnector(BaseConnector):
             bool: Indicating success or failure
         """
 
-        _, temp_filename = mkstemp()
-
-        try:
+        with NamedTemporaryFile() as temp_f:
             # Load our file or IO object and write it to the temporary file
             with get_file_io(filename_or_io) as file_io:
-                with open(temp_filename, "wb") as temp_f:
-                    data = file_io.read()
-
-                    if isinstance(data, str):
-                        data = data.encode()
-
-                    temp_f.write(data)
+                copy_file_io(file_io, temp_f)
+                temp_f.flush()
 
             # Copy the file using `cp` such that we support sudo/su
             status, output = self.run_shell_command(
-                StringCommand("cp", temp_filename, QuoteString(remote_filename)),
+                StringCommand("cp", temp_f.name, QuoteString(remote_filename)),
                 print_output=print_output,
                 print_input=print_input,
                 **arguments,
@@ -141,8 +133,6 @@ class LocalConnector(BaseConnector):
 
             if not status:
                 raise IOError(output.stderr)
-        finally:
-            os.remove(temp_filename)
 
         if print_output:
             click.echo(
@@ -169,12 +159,10 @@ class LocalConnector(BaseConnector):
             bool: Indicating success or failure
         """
 
-        _, temp_filename = mkstemp()
-
-        try:
+        with NamedTemporaryFile() as temp_f:
             # Copy the file using `cp` such that we support sudo/su
             status, output = self.run_shell_command(
-                StringCommand("cp", remote_filename, temp_filename),
+                StringCommand("cp", remote_filename, temp_f.name),
                 print_output=print_output,
                 print_input=print_input,
                 **arguments,
@@ -183,20 +171,9 @@ class LocalConnector(BaseConnector):
             if not status:
                 raise IOError(output.stderr)
 
-            # Load our file or IO object and write it to the temporary file
-            with open(temp_filename, "rb") as temp_f:
-                with get_file_io(filename_or_io, "wb") as file_io:
-                    data_bytes: bytes
-
-                    data = temp_f.read()
-                    if isinstance(data, str):
-                        data_bytes = data.encode()
-                    else:
-                        data_bytes = data
-
-                    file_io.write(data_bytes)
-        finally:
-            os.remove(temp_filename)
+            # Load the temporary file and write it to our file or IO object
+            with get_file_io(filename_or_io, "wb") as file_io:
+                copy_file_io(temp_f, file_io)
 
         if print_output:
             click.echo(
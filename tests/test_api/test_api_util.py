@@ -1,7 +1,18 @@
+import gzip
+import os
 from io import BytesIO, StringIO
-from unittest import TestCase
+from tempfile import TemporaryFile
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 
-from pyinfra.api.util import format_exception, get_caller_frameinfo, get_file_io, try_int
+from pyinfra.api.util import (
+    BLOCKSIZE,
+    copy_file_io,
+    format_exception,
+    get_caller_frameinfo,
+    get_file_io,
+    try_int,
+)
 
 
 class TestApiUtil(TestCase):
@@ -16,7 +27,7 @@ class TestApiUtil(TestCase):
             return get_caller_frameinfo()
 
         frameinfo = _get_caller_frameinfo()
-        assert frameinfo.lineno == 18  # called by the line above
+        assert frameinfo.lineno == 29  # called by the line above
 
     def test_format_exception(self):
         exception = Exception("I am a message", 1)
@@ -59,3 +70,72 @@ class TestApiUtilFileIO(TestCase):
 
         assert isinstance(data, str)
         assert data == "some string"
+
+    def test_copy_file_io_stringio(self):
+        file = StringIO("some string")
+        dest = BytesIO()
+
+        copy_file_io(file, dest)
+
+        assert dest.getvalue() == b"some string"
+
+    def test_copy_file_io_bytesio_multiple_blocks(self):
+        data = b"x" * (BLOCKSIZE * 2 + 1)
+        dest = BytesIO()
+
+        copy_file_io(BytesIO(data), dest)
+
+        assert dest.getvalue() == data
+
+    def test_copy_file_io_real_files(self):
+        data = b"x" * (BLOCKSIZE * 2 + 1)
+
+        with TemporaryFile() as file, TemporaryFile() as dest:
+            file.write(data)
+            file.seek(0)
+
+            copy_file_io(file, dest)
+
+            dest.seek(0)
+            assert dest.read() == data
+
+    def test_copy_file_io_real_files_sendfile_unsupported(self):
+        with TemporaryFile() as file, TemporaryFile() as dest:
+            file.write(b"some string")
+            file.seek(0)
+
+            with patch("pyinfra.api.util.os.sendfile", side_effect=OSError, create=True):
+                copy_file_io(file, dest)
+
+            dest.seek(0)
+            assert dest.read() == b"some string"
+
+    @skipUnless(os.path.exists("/proc/self/status"), "requires procfs")
+    def test_copy_file_io_real_file_larger_than_stat_size(self):
+        # procfs files report a size of 0 but have content
+        with open("/proc/self/status", "rb") as file:
+            expected_prefix = file.read(16)
+
+        with open("/proc/self/status", "rb") as file, TemporaryFile() as dest:
+            assert os.fstat(file.fileno()).st_size < BLOCKSIZE
+
+            copy_file_io(file, dest)
+
+            dest.seek(0)
+            data = dest.read()
+
+        assert data.startswith(expected_prefix)
+        assert b"\nPid:" in data
+
+    def test_copy_file_io_non_string_mode(self):
+        compressed = BytesIO()
+        with gzip.GzipFile(fileobj=compressed, mode="wb") as gzip_file:
+            gzip_file.write(b"some string")
+        compressed.seek(0)
+
+        dest = BytesIO()
+
+        with gzip.GzipFile(fileobj=compressed, mode="rb") as file:
+            copy_file_io(file, dest)
+
+        assert dest.getvalue() == b"some string"
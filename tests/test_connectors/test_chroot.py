@@ -1,9 +1,10 @@
 # encoding: utf-8
 
 import shlex
+from io import BytesIO
 from subprocess import PIPE
 from unittest import TestCase
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import mock_open, patch
 
 from pyinfra.api import Config, State
 from pyinfra.api.connect import connect_all
@@ -21,11 +22,20 @@ def fake_chroot_shell(command, splitlines=None):
 
 
 @patch("pyinfra.connectors.chroot.local.shell", fake_chroot_shell)
-@patch("pyinfra.connectors.chroot.mkstemp", lambda: (None, "__tempfile__"))
-@patch("pyinfra.connectors.chroot.os.remove", lambda f: None)
 @patch("pyinfra.connectors.chroot.open", mock_open(read_data="test!"), create=True)
 @patch("pyinfra.api.util.open", mock_open(read_data="test!"), create=True)
 class TestChrootConnector(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Share one connected inventory between the tests that only need a live host
+        cls.inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
+        cls.state = State(cls.inventory, Config())
+
+        with patch("pyinfra.connectors.chroot.local.shell", fake_chroot_shell):
+            connect_all(cls.state)
+
+        cls.host = cls.inventory.get_host("@chroot/not-a-chroot")
+
     def setUp(self):
         self.fake_popen_patch = patch("pyinfra.connectors.util.Popen")
         self.fake_popen_mock = self.fake_popen_patch.start()
@@ -54,10 +64,7 @@ class TestChrootConnector(TestCase):
             connect_all(state)
 
     def test_run_shell_command(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        State(inventory, Config())
-        host = inventory.get_host("@chroot/not-a-chroot")
-        host.connect()
+        host = self.host
 
         command = "echo hoi"
         self.fake_popen_mock().returncode = 0
@@ -70,10 +77,9 @@ class TestChrootConnector(TestCase):
         assert len(out) == 2
         assert out[0] is True
 
-        command = make_unix_command(command).get_raw_value()
         command = shlex.quote(command)
-        docker_command = "chroot /not-a-chroot sh -c {0}".format(command)
-        shell_command = make_unix_command(docker_command).get_raw_value()
+        chroot_command = "chroot /not-a-chroot sh -c {0}".format(command)
+        shell_command = make_unix_command(chroot_command).get_raw_value()
 
         self.fake_popen_mock.assert_called_with(
             shell_command,
@@ -83,12 +89,30 @@ class TestChrootConnector(TestCase):
             stdin=PIPE,
         )
 
-    def test_run_shell_command_success_exit_codes(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        state = State(inventory, Config())
-        connect_all(state)
+    def test_run_shell_command_with_sudo(self):
+        host = self.host
 
-        host = inventory.get_host("@chroot/not-a-chroot")
+        command = "echo hoi"
+        self.fake_popen_mock().returncode = 0
+        out = host.run_shell_command(command, _sudo=True)
+        assert len(out) == 2
+        assert out[0] is True
+
+        command = make_unix_command(command, _sudo=True).get_raw_value()
+        command = shlex.quote(command)
+        chroot_command = "chroot /not-a-chroot sh -c {0}".format(command)
+        shell_command = make_unix_command(chroot_command).get_raw_value()
+
+        self.fake_popen_mock.assert_called_with(
+            shell_command,
+            shell=True,
+            stdout=PIPE,
+            stderr=PIPE,
+            stdin=PIPE,
+        )
+
+    def test_run_shell_command_success_exit_codes(self):
+        host = self.host
 
         command = "echo hoi"
         self.fake_popen_mock().returncode = 1
@@ -98,11 +122,7 @@ class TestChrootConnector(TestCase):
         assert out[0] is True
 
     def test_run_shell_command_error(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        state = State(inventory, Config())
-        connect_all(state)
-
-        host = inventory.get_host("@chroot/not-a-chroot")
+        host = self.host
 
         command = "echo hoi"
         self.fake_popen_mock().returncode = 1
@@ -112,67 +132,42 @@ class TestChrootConnector(TestCase):
         assert out[0] is False
 
     def test_put_file(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        state = State(inventory, Config())
-        connect_all(state)
+        host = self.host
 
-        host = inventory.get_host("@chroot/not-a-chroot")
-
-        fake_process = MagicMock(returncode=0)
-        self.fake_popen_mock.return_value = fake_process
-
-        host.put_file("not-a-file", "not-another-file", print_output=True)
+        fake_open = mock_open()
+        with patch("pyinfra.connectors.chroot.open", fake_open, create=True):
+            host.put_file("not-a-file", "not-another-file", print_output=True)
 
-        self.fake_popen_mock.assert_called_with(
-            "sh -c 'cp __tempfile__ /not-a-chroot/not-another-file'",
-            shell=True,
-            stdout=PIPE,
-            stderr=PIPE,
-            stdin=PIPE,
-        )
+        fake_open.assert_called_with("/not-a-chroot/not-another-file", "wb")
+        fake_open().write.assert_called_with(b"test!")
+        self.fake_popen_mock.assert_not_called()
 
     def test_put_file_error(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        state = State(inventory, Config())
-        connect_all(state)
-
-        host = inventory.get_host("@chroot/not-a-chroot")
-
-        fake_process = MagicMock(returncode=1)
-        self.fake_popen_mock.return_value = fake_process
+        host = self.host
 
-        with self.assertRaises(IOError):
-            host.put_file("not-a-file", "not-another-file", print_output=True)
+        fake_open = mock_open()
+        fake_open.side_effect = PermissionError()
+        with patch("pyinfra.connectors.chroot.open", fake_open, create=True):
+            with self.assertRaises(IOError):
+                host.put_file("not-a-file", "not-another-file", print_output=True)
 
     def test_get_file(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        state = State(inventory, Config())
-        connect_all(state)
+        host = self.host
 
-        host = inventory.get_host("@chroot/not-a-chroot")
+        fake_open = mock_open(read_data=b"test!")
+        with patch("pyinfra.connectors.chroot.open", fake_open, create=True):
+            file_io = BytesIO()
+            host.get_file("not-a-file", file_io, print_output=True)
 
-        fake_process = MagicMock(returncode=0)
-        self.fake_popen_mock.return_value = fake_process
-
-        host.get_file("not-a-file", "not-another-file", print_output=True)
-
-        self.fake_popen_mock.assert_called_with(
-            "sh -c 'cp /not-a-chroot/not-a-file __tempfile__'",
-            shell=True,
-            stdout=PIPE,
-            stderr=PIPE,
-            stdin=PIPE,
-        )
+        fake_open.assert_called_with("/not-a-chroot/not-a-file", "rb")
+        assert file_io.getvalue() == b"test!"
+        self.fake_popen_mock.assert_not_called()
 
     def test_get_file_error(self):
-        inventory = make_inventory(hosts=("@chroot/not-a-chroot",))
-        state = State(inventory, Config())
-        connect_all(state)
-
-        host = inventory.get_host("@chroot/not-a-chroot")
-
-        fake_process = MagicMock(returncode=1)
-        self.fake_popen_mock.return_value = fake_process
+        host = self.host
 
-        with self.assertRaises(IOError):
-            host.get_file("not-a-file", "not-another-file", print_output=True)
+        fake_open = mock_open()
+        fake_open.side_effect = FileNotFoundError()
+        with patch("pyinfra.connectors.chroot.open", fake_open, create=True):
+            with self.assertRaises(IOError):
+                host.get_file("not-a-file", "not-another-file", print_output=True)
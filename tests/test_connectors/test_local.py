@@ -1,6 +1,6 @@
 # encoding: utf-8
 
-from io import StringIO
+from io import BytesIO, StringIO
 from subprocess import PIPE
 from unittest import TestCase
 from unittest.mock import MagicMock, call, mock_open, patch
@@ -12,9 +12,18 @@ from pyinfra.connectors.util import make_unix_command
 from ..util import make_inventory
 
 
-@patch("pyinfra.connectors.local.mkstemp", lambda: (None, "__tempfile__"))
-@patch("pyinfra.connectors.local.os.remove", lambda f: None)
-@patch("pyinfra.connectors.local.open", mock_open(read_data="test!"), create=True)
+def fake_named_temporary_file():
+    fake_file = MagicMock()
+    fake_file.name = "__tempfile__"
+    fake_file.mode = "rb+"
+    # No real descriptor, so copies have to go through the buffered read/write path
+    fake_file.fileno.side_effect = OSError
+    fake_file.read.side_effect = [b"test!", b""]
+    fake_file.__enter__.return_value = fake_file
+    return fake_file
+
+
+@patch("pyinfra.connectors.local.NamedTemporaryFile", fake_named_temporary_file)
 @patch("pyinfra.api.util.open", mock_open(read_data="test!"), create=True)
 class TestLocalConnector(TestCase):
     def setUp(self):
@@ -179,7 +188,8 @@ class TestLocalConnector(TestCase):
         fake_process = MagicMock(returncode=0)
         self.fake_popen_mock.return_value = fake_process
 
-        host.get_file("not-a-file", "not-another-file", print_output=True)
+        file_io = BytesIO()
+        host.get_file("not-a-file", file_io, print_output=True)
 
         self.fake_popen_mock.assert_called_with(
             "sh -c 'cp not-a-file __tempfile__'",
@@ -188,6 +198,7 @@ class TestLocalConnector(TestCase):
             stderr=PIPE,
             stdin=PIPE,
         )
+        assert file_io.getvalue() == b"test!"
 
     def test_get_file_error(self):
         inventory = make_inventory(hosts=("@local",))